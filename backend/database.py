@@ -1,132 +1,646 @@
+import asyncio
 import aiosqlite
-import json
-from typing import Optional, List, Dict, Any
-from datetime import datetime
+import orjson
+from contextlib import asynccontextmanager
+import sqlite3
+import zlib
+from typing import Optional, List, Dict, Any, AsyncIterator, Iterable
 
 DATABASE_PATH = "gavelai.db"
 
+# Process-wide connections, opened once by init_db(). Opening a connection per
+# request costs a worker thread, a file open and a cold page cache each time.
+# sqlite only ever runs one writer, so there is a single lock-guarded writer
+# connection plus a small pool of read-only connections that WAL lets run
+# alongside it.
+READER_POOL_SIZE = 4
+_writer: Optional[aiosqlite.Connection] = None
+_write_lock = asyncio.Lock()
+_readers: Optional[asyncio.Queue] = None
+_reader_conns: List[aiosqlite.Connection] = []
+
+# Per-connection tuning, applied to every connection we open. journal_mode is
+# persisted in the database file, so init_db() only sets it once.
+CONNECTION_PRAGMAS = """
+PRAGMA synchronous = NORMAL;
+PRAGMA temp_store = MEMORY;
+PRAGMA cache_size = -64000;      -- 64 MiB
+PRAGMA mmap_size = 268435456;    -- 256 MiB
+PRAGMA busy_timeout = 5000;
+PRAGMA foreign_keys = ON;
+"""
+
+# Surrogate ids are plain INTEGER PRIMARY KEY (rowid aliases) unless noted:
+# AUTOINCREMENT costs an extra sqlite_sequence write on every insert.
+# Tables are STRICT: values are stored as exactly the declared type instead
+# of going through type-affinity coercion, and wrong types fail loudly.
+# Foreign keys are enforced (CONNECTION_PRAGMAS) and deferred to commit by
+# get_writer(); each table notes what its constraints guard.
+SCHEMA = """
+-- Submissions table. Only the narrow columns listings and joins touch; the
+-- uploaded payload lives in submission_payloads so these rows stay small
+-- and many of them fit on each b-tree page.
+CREATE TABLE IF NOT EXISTS submissions (
+    id TEXT PRIMARY KEY,
+    queue_id TEXT NOT NULL,
+    labeling_task_id TEXT NOT NULL,
+    created_at INTEGER NOT NULL
+) STRICT;
+
+-- Raw uploaded JSON per submission (zlib-compressed, see pack_raw_data()).
+-- FK: written in the same transaction as its submission, deleted with it.
+CREATE TABLE IF NOT EXISTS submission_payloads (
+    submission_id TEXT PRIMARY KEY,
+    raw_data BLOB NOT NULL,
+    FOREIGN KEY (submission_id) REFERENCES submissions(id)
+) WITHOUT ROWID, STRICT;
+
+-- Questions table. Keyed by (submission, template) and stored WITHOUT ROWID,
+-- so a submission's questions sit contiguously in the primary b-tree.
+-- FK: the evaluation run and review joins assume every question's
+-- submission exists; upload inserts both in one transaction.
+CREATE TABLE IF NOT EXISTS questions (
+    submission_id TEXT NOT NULL,
+    question_template_id TEXT NOT NULL,
+    question_type TEXT NOT NULL,
+    question_text TEXT NOT NULL,
+    content TEXT,
+    rev INTEGER NOT NULL,
+    PRIMARY KEY (submission_id, question_template_id),
+    FOREIGN KEY (submission_id) REFERENCES submissions(id)
+) WITHOUT ROWID, STRICT;
+
+-- Answers table (one answer per question of a submission, WITHOUT ROWID).
+-- FK: same as questions.
+CREATE TABLE IF NOT EXISTS answers (
+    submission_id TEXT NOT NULL,
+    question_template_id TEXT NOT NULL,
+    choice TEXT NOT NULL,
+    reasoning TEXT,
+    PRIMARY KEY (submission_id, question_template_id),
+    FOREIGN KEY (submission_id) REFERENCES submissions(id)
+) WITHOUT ROWID, STRICT;
+
+-- Judges table. Unlike the other tables, judge ids keep AUTOINCREMENT: a
+-- deleted judge's id must never be handed to a new judge, or its leftover
+-- evaluations would be attributed to the wrong judge (databases written
+-- before foreign keys were enforced may still hold such rows).
+CREATE TABLE IF NOT EXISTS judges (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL UNIQUE,
+    system_prompt TEXT NOT NULL,
+    model_name TEXT NOT NULL,
+    active INTEGER NOT NULL DEFAULT 1 CHECK (active IN (0, 1)),
+    created_at INTEGER NOT NULL
+) STRICT;
+
+-- Judge assignments table (many-to-many: judges <-> questions in queue).
+-- FK: rejects assignments to unknown judges; delete_judge removes them.
+CREATE TABLE IF NOT EXISTS judge_assignments (
+    id INTEGER PRIMARY KEY,
+    queue_id TEXT NOT NULL,
+    question_template_id TEXT NOT NULL,
+    judge_id INTEGER NOT NULL,
+    created_at INTEGER NOT NULL,
+    FOREIGN KEY (judge_id) REFERENCES judges(id),
+    UNIQUE(queue_id, question_template_id, judge_id)
+) STRICT;
+
+-- Evaluations table. FK: verdicts always belong to an existing judge and
+-- submission; delete_judge and delete_queue remove them with their parent.
+CREATE TABLE IF NOT EXISTS evaluations (
+    id INTEGER PRIMARY KEY,
+    submission_id TEXT NOT NULL,
+    question_template_id TEXT NOT NULL,
+    judge_id INTEGER NOT NULL,
+    verdict TEXT NOT NULL,
+    reasoning TEXT NOT NULL,
+    confidence_score INTEGER NOT NULL DEFAULT 50,
+    created_at INTEGER NOT NULL,
+    FOREIGN KEY (submission_id) REFERENCES submissions(id),
+    FOREIGN KEY (judge_id) REFERENCES judges(id)
+) STRICT;
+
+-- Review queue table (human-in-the-loop escalation). FK: deleted along
+-- with the queue its submission belonged to.
+CREATE TABLE IF NOT EXISTS review_queue (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    submission_id TEXT NOT NULL,
+    question_template_id TEXT NOT NULL,
+    escalation_reasons TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    human_verdict TEXT,
+    human_comment TEXT,
+    reviewed_by TEXT,
+    created_at TEXT NOT NULL,
+    reviewed_at TEXT,
+    FOREIGN KEY (submission_id) REFERENCES submissions(id),
+    UNIQUE(submission_id, question_template_id)
+) STRICT;
+
+-- Indexes on the child side of each foreign key. Column order follows the
+-- predicates the API uses (submission first, then question template).
+-- questions and answers are clustered on that key already, and
+-- judge_assignments(queue_id, question_template_id) and
+-- review_queue(submission_id, question_template_id) are covered by their
+-- UNIQUE constraints.
+CREATE INDEX IF NOT EXISTS idx_submissions_queue ON submissions(queue_id);
+CREATE INDEX IF NOT EXISTS idx_evaluations_sub_q ON evaluations(submission_id, question_template_id);
+CREATE INDEX IF NOT EXISTS idx_evaluations_judge ON evaluations(judge_id);
+
+-- Active judges assigned to each (queue, question template): the innermost
+-- lookup of an evaluation run. The partial index only holds active judges,
+-- and judge_assignments' UNIQUE(queue_id, question_template_id, judge_id)
+-- index covers the assignment side of the join.
+CREATE INDEX IF NOT EXISTS idx_judges_active ON judges(active) WHERE active = 1;
+CREATE VIEW IF NOT EXISTS active_assignments AS
+    SELECT ja.queue_id, ja.question_template_id, j.id AS judge_id,
+           j.name, j.system_prompt, j.model_name
+    FROM judge_assignments ja
+    JOIN judges j ON j.id = ja.judge_id
+    WHERE j.active = 1;
+"""
+
+
+# Canonical insert statements. sqlite3 caches prepared statements per
+# connection keyed by SQL text, so every caller sharing these strings reuses
+# one compiled statement instead of re-parsing its own copy.
+INSERT_SUBMISSION_SQL = """
+    INSERT OR REPLACE INTO submissions
+    (id, queue_id, labeling_task_id, created_at)
+    VALUES (?, ?, ?, ?)
+"""
+INSERT_PAYLOAD_SQL = """
+    INSERT OR REPLACE INTO submission_payloads
+    (submission_id, raw_data)
+    VALUES (?, ?)
+"""
+INSERT_QUESTION_SQL = """
+    INSERT OR REPLACE INTO questions
+    (submission_id, question_template_id, question_type, question_text, content, rev)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+INSERT_ANSWER_SQL = """
+    INSERT OR REPLACE INTO answers
+    (submission_id, question_template_id, choice, reasoning)
+    VALUES (?, ?, ?, ?)
+"""
+INSERT_ASSIGNMENT_SQL = """
+    INSERT OR IGNORE INTO judge_assignments
+    (queue_id, question_template_id, judge_id, created_at)
+    VALUES (?, ?, ?, ?)
+"""
+INSERT_EVALUATION_SQL = """
+    INSERT INTO evaluations
+    (submission_id, question_template_id, judge_id, verdict, reasoning, confidence_score, created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Stored in PRAGMA user_version once the schema and migrations have been
+# applied; bump it whenever SCHEMA or the migrations in _setup_database()
+# change so existing databases pick them up on the next start.
+SCHEMA_VERSION = 4
+
+# Size of sqlite3's per-connection prepared-statement cache. The default (128)
+# is easily cycled by the filter endpoints' dynamically built queries.
+STATEMENT_CACHE_SIZE = 512
+
+
+def _schema_sql() -> str:
+    if sqlite3.sqlite_version_info >= (3, 37, 0):
+        return SCHEMA
+    # STRICT tables need sqlite 3.37+; older libraries get ordinary tables
+    return SCHEMA.replace(", STRICT;", ";").replace(" STRICT;", ";")
+
 
 async def init_db():
-    """Initialize database with required tables."""
-    async with aiosqlite.connect(DATABASE_PATH) as db:
-        # Submissions table
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS submissions (
-                id TEXT PRIMARY KEY,
-                queue_id TEXT NOT NULL,
-                labeling_task_id TEXT NOT NULL,
-                created_at INTEGER NOT NULL,
-                raw_data TEXT NOT NULL
-            )
-        """)
-        
-        # Questions table
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS questions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                submission_id TEXT NOT NULL,
-                question_template_id TEXT NOT NULL,
-                question_type TEXT NOT NULL,
-                question_text TEXT NOT NULL,
-                content TEXT,
-                rev INTEGER NOT NULL,
-                FOREIGN KEY (submission_id) REFERENCES submissions(id)
-            )
-        """)
-        
-        # Answers table
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS answers (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                submission_id TEXT NOT NULL,
-                question_template_id TEXT NOT NULL,
-                choice TEXT NOT NULL,
-                reasoning TEXT,
-                FOREIGN KEY (submission_id) REFERENCES submissions(id)
-            )
-        """)
-        
-        # Judges table
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS judges (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL UNIQUE,
-                system_prompt TEXT NOT NULL,
-                model_name TEXT NOT NULL,
-                active BOOLEAN NOT NULL DEFAULT 1,
-                created_at TEXT NOT NULL
-            )
-        """)
-        
-        # Judge assignments table (many-to-many: judges <-> questions in queue)
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS judge_assignments (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                queue_id TEXT NOT NULL,
-                question_template_id TEXT NOT NULL,
-                judge_id INTEGER NOT NULL,
-                created_at TEXT NOT NULL,
-                FOREIGN KEY (judge_id) REFERENCES judges(id),
-                UNIQUE(queue_id, question_template_id, judge_id)
-            )
-        """)
-        
-        # Evaluations table
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS evaluations (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                submission_id TEXT NOT NULL,
-                question_template_id TEXT NOT NULL,
-                judge_id INTEGER NOT NULL,
-                verdict TEXT NOT NULL,
-                reasoning TEXT NOT NULL,
-                confidence_score INTEGER NOT NULL DEFAULT 50,
-                created_at TEXT NOT NULL,
-                FOREIGN KEY (submission_id) REFERENCES submissions(id),
-                FOREIGN KEY (judge_id) REFERENCES judges(id)
-            )
-        """)
-        
-        # Review queue table (human-in-the-loop escalation)
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS review_queue (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                submission_id TEXT NOT NULL,
-                question_template_id TEXT NOT NULL,
-                escalation_reasons TEXT NOT NULL,
-                status TEXT NOT NULL DEFAULT 'pending',
-                human_verdict TEXT,
-                human_comment TEXT,
-                reviewed_by TEXT,
-                created_at TEXT NOT NULL,
-                reviewed_at TEXT,
-                FOREIGN KEY (submission_id) REFERENCES submissions(id),
-                UNIQUE(submission_id, question_template_id)
-            )
-        """)
-        
+    """Open the connections and initialize the database with required tables."""
+    global _writer, _readers
+    if _writer is not None:
+        return
+    # Schema setup is a burst of back-to-back statements with nothing to
+    # interleave, so it runs on a plain sqlite3 connection in one thread hop
+    # rather than one aiosqlite round-trip per statement.
+    await asyncio.to_thread(_setup_database, DATABASE_PATH)
+    _writer = await _connect(DATABASE_PATH)
+
+    # Readers are opened after the schema exists; mode=ro makes sure a read
+    # endpoint can never write behind the writer lock's back.
+    _readers = asyncio.Queue()
+    for _ in range(READER_POOL_SIZE):
+        reader = await _connect(f"file:{DATABASE_PATH}?mode=ro", uri=True)
+        _reader_conns.append(reader)
+        _readers.put_nowait(reader)
+
+    await evaluation_writer.start()
+
+
+def _setup_database(path: str):
+    """Create the schema and apply migrations (blocking; run off the event loop)."""
+    conn = sqlite3.connect(path, isolation_level=None)
+    try:
+        conn.executescript(CONNECTION_PRAGMAS)
+
+        # WAL lets readers proceed while a writer commits and avoids fsyncing
+        # a rollback journal on every transaction.
+        (journal_mode,) = conn.execute("PRAGMA journal_mode").fetchall()[0]
+        if journal_mode.lower() != "wal":
+            conn.execute("PRAGMA journal_mode = WAL")
+
+        # Nothing to do if this database is already at the current schema
+        (version, has_tables) = conn.execute(
+            """SELECT (SELECT user_version FROM pragma_user_version),
+                      EXISTS (SELECT 1 FROM sqlite_master
+                              WHERE type = 'table' AND name = 'evaluations')"""
+        ).fetchall()[0]
+        if version == SCHEMA_VERSION and has_tables:
+            return
+
+        # All tables are created by one script in a single transaction, so the
+        # whole schema costs one commit instead of one per statement.
+        conn.executescript(f"BEGIN;\n{_schema_sql()}COMMIT;")
+
         # Migration: add confidence_score column if DB already existed
         try:
-            await db.execute(
+            conn.execute(
                 "ALTER TABLE evaluations ADD COLUMN confidence_score INTEGER NOT NULL DEFAULT 50"
             )
         except Exception:
             pass  # Column already exists
-        
+
         # Migration: add content column to questions table if DB already existed
         try:
-            await db.execute(
-                "ALTER TABLE questions ADD COLUMN content TEXT"
-            )
+            conn.execute("ALTER TABLE questions ADD COLUMN content TEXT")
         except Exception:
             pass  # Column already exists
-        
-        await db.commit()
 
+        # Migration: raw_data moved from submissions to submission_payloads.
+        # Payloads stored before compression are compressed on the way.
+        if conn.execute(
+            "SELECT 1 FROM pragma_table_info('submissions') WHERE name = 'raw_data'"
+        ).fetchall():
+            conn.execute("BEGIN")
+            conn.executemany(
+                INSERT_PAYLOAD_SQL,
+                [
+                    (sub_id, pack_raw_data(raw) if isinstance(raw, str) else raw)
+                    for sub_id, raw in conn.execute("SELECT id, raw_data FROM submissions")
+                ],
+            )
+            conn.execute("ALTER TABLE submissions DROP COLUMN raw_data")
+            conn.execute("COMMIT")
+
+        # Foreign keys are off while tables are rebuilt: dropping a parent
+        # would otherwise delete through it. The setting only changes
+        # outside a transaction.
+        conn.execute("PRAGMA foreign_keys = OFF")
+        conn.execute("BEGIN")
+        # Migration: older versions stored these timestamps as local-time ISO
+        # strings; convert them to unix epoch milliseconds
+        for table in ("judges", "judge_assignments", "evaluations"):
+            conn.execute(
+                f"""UPDATE {table}
+                    SET created_at = CAST(ROUND(
+                        (julianday(created_at, 'utc') - 2440587.5) * 86400000
+                    ) AS INTEGER)
+                    WHERE created_at LIKE '____-__-__T%'"""
+            )
+        _rebuild_changed_tables(conn)
+        conn.execute("COMMIT")
+        conn.execute("PRAGMA foreign_keys = ON")
+
+        # Recreate the indexes and views that went away with rebuilt tables
+        conn.executescript(
+            f"BEGIN;\n{_schema_sql()}PRAGMA user_version = {SCHEMA_VERSION};\nCOMMIT;"
+        )
+
+        # Give the planner statistics for the indexes; close_db() keeps them
+        # current with PRAGMA optimize
+        conn.execute("ANALYZE")
+    finally:
+        conn.close()
+
+
+def _rebuild_changed_tables(conn: sqlite3.Connection):
+    """Rebuild tables whose stored definition differs from SCHEMA.
+
+    CREATE TABLE IF NOT EXISTS leaves a table from an older version as it
+    was, so it would keep an old key, rowid layout or column types. Each such
+    table is recreated from SCHEMA and its rows copied over in rowid order
+    with INSERT OR REPLACE, so where the old table held several rows for the
+    new key (e.g. questions re-uploaded before they were keyed by
+    submission and template) the newest one is kept. Views are dropped and
+    indexes go with their table; the caller recreates both from SCHEMA.
+    Runs inside the caller's transaction, with foreign keys off.
+    """
+    expected = sqlite3.connect(":memory:")
+    try:
+        expected.executescript(_schema_sql())
+        definitions = expected.execute(
+            """SELECT name, sql FROM sqlite_master
+               WHERE type = 'table' AND name NOT LIKE 'sqlite_%'"""
+        ).fetchall()
+    finally:
+        expected.close()
+    current = dict(conn.execute("SELECT name, sql FROM sqlite_master WHERE type = 'table'"))
+    changed = [(name, sql) for name, sql in definitions if current[name] != sql]
+    if not changed:
+        return
 
-async def get_db():
-    """Get database connection."""
-    db = await aiosqlite.connect(DATABASE_PATH)
-    db.row_factory = aiosqlite.Row
+    # A view over a table that is being swapped out no longer compiles, which
+    # makes ALTER TABLE ... RENAME fail
+    for (view,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'view'").fetchall():
+        conn.execute(f"DROP VIEW {view}")
+
+    # The old table is moved aside so the new one is created from SCHEMA's
+    # exact text; legacy_alter_table keeps the rename from rewriting the
+    # REFERENCES clauses of other tables to point at the old copy
+    conn.execute("PRAGMA legacy_alter_table = ON")
+    for name, sql in changed:
+        old_name = f"{name}_old"
+        conn.execute(f"ALTER TABLE {name} RENAME TO {old_name}")
+        conn.execute(sql)
+        new_columns = [
+            column for (column,) in conn.execute("SELECT name FROM pragma_table_info(?)", (name,))
+        ]
+        old_columns = {
+            column for (column,) in conn.execute("SELECT name FROM pragma_table_info(?)", (old_name,))
+        }
+        columns = ", ".join(column for column in new_columns if column in old_columns)
+        order = "" if "WITHOUT ROWID" in current[name].upper() else " ORDER BY rowid"
+        conn.execute(
+            f"INSERT OR REPLACE INTO {name} ({columns}) SELECT {columns} FROM {old_name}{order}"
+        )
+        if "AUTOINCREMENT" in sql:
+            # Keep the old high-water mark, which can be above the largest
+            # surviving id, so deleted ids are still never reused
+            conn.execute("DELETE FROM sqlite_sequence WHERE name = ?", (name,))
+            conn.execute("UPDATE sqlite_sequence SET name = ? WHERE name = ?", (name, old_name))
+        conn.execute(f"DROP TABLE {old_name}")
+    conn.execute("PRAGMA legacy_alter_table = OFF")
+
+
+async def _connect(database: str, **kwargs) -> aiosqlite.Connection:
+    db = await aiosqlite.connect(
+        database, cached_statements=STATEMENT_CACHE_SIZE, **kwargs
+    )
+    # executescript steps every PRAGMA to completion, so none of them is left
+    # as an open statement on the connection.
+    await db.executescript(CONNECTION_PRAGMAS)
     return db
 
+
+@asynccontextmanager
+async def get_reader():
+    """Borrow a read-only connection from the pool for the duration of the block."""
+    db = await _readers.get()
+    try:
+        yield db
+    finally:
+        _readers.put_nowait(db)
+
+
+@asynccontextmanager
+async def get_writer():
+    """Hold the writer connection exclusively for the duration of the block.
+
+    The holder owns the connection's transaction and must commit before
+    leaving; an exception rolls back whatever it left uncommitted.
+    Foreign-key checks in the block's first transaction are deferred to its
+    commit, so bulk inserts are validated once rather than row by row.
+    """
+    async with _write_lock:
+        try:
+            # Reset by sqlite at every COMMIT/ROLLBACK
+            await _writer.execute("PRAGMA defer_foreign_keys = ON")
+            yield _writer
+        except BaseException:
+            await _writer.rollback()
+            raise
+
+
+async def close_db():
+    """Close all database connections (called on app shutdown)."""
+    global _writer, _readers
+    await evaluation_writer.stop()
+    for reader in _reader_conns:
+        await reader.close()
+    _reader_conns.clear()
+    _readers = None
+    if _writer is not None:
+        # Re-analyzes only the tables whose statistics have gone stale
+        await _writer.executescript("PRAGMA optimize;")
+        await _writer.close()
+        _writer = None
+
+
+async def bulk_insert(
+    db: aiosqlite.Connection,
+    sql: str,
+    rows: Iterable[tuple],
+    batch: int = 500,
+    commit: bool = True,
+) -> int:
+    """Insert rows with executemany, `batch` rows per call, in one transaction.
+
+    A list is already in memory and goes to a single executemany call (one
+    hop to the connection's thread); other iterables are consumed `batch`
+    rows at a time so generators are never fully materialized.
+
+    With commit=False the rows are left in the caller's open transaction so
+    several tables can be written atomically. Returns the number of rows.
+    """
+    count = 0
+    buf: list = []
+    try:
+        if isinstance(rows, list):
+            if rows:
+                await db.executemany(sql, rows)
+            count = len(rows)
+            rows = ()
+        for row in rows:
+            buf.append(row)
+            if len(buf) >= batch:
+                await db.executemany(sql, buf)
+                count += len(buf)
+                buf = []
+        if buf:
+            await db.executemany(sql, buf)
+            count += len(buf)
+        if commit:
+            await db.commit()
+    except Exception:
+        if commit:
+            await db.rollback()
+        raise
+    return count
+
+
+class EvaluationWriter:
+    """Coalesces evaluation inserts into batched transactions.
+
+    Rows passed to submit() are buffered and written by a background task,
+    one executemany + commit per batch: as soon as max_rows rows are pending
+    or max_delay_ms after the first of them arrived, whichever comes first.
+    A batch that fails is retried row by row, so one bad row (say, for a
+    judge deleted mid-run) only fails its own submitter.
+    """
+
+    def __init__(self, max_rows: int = 200, max_delay_ms: int = 100):
+        self.max_rows = max_rows
+        self.max_delay = max_delay_ms / 1000
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        """Start the background flusher task."""
+        if self._task is None:
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._flusher())
+
+    async def stop(self):
+        """Write out everything still buffered and stop the flusher."""
+        if self._task is None:
+            return
+        try:
+            await self.flush()
+        finally:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def submit(self, row: tuple) -> asyncio.Future:
+        """Queue one row for INSERT_EVALUATION_SQL.
+
+        Returns a future that resolves once the row is committed, or raises
+        the error that kept this row from being written. Await it.
+        """
+        written = asyncio.get_running_loop().create_future()
+        await self._queue.put((row, written))
+        return written
+
+    async def flush(self):
+        """Wait until every row submitted so far has been written or failed."""
+        done = asyncio.get_running_loop().create_future()
+        await self._queue.put(done)
+        await done
+
+    async def _flusher(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await self._queue.get()
+            rows: list = []
+            futures: list = []
+            waiters: list = []
+            deadline = loop.time() + self.max_delay
+            while True:
+                if isinstance(item, asyncio.Future):
+                    # A flush() is waiting: write what we have right away
+                    waiters.append(item)
+                    break
+                rows.append(item[0])
+                futures.append(item[1])
+                if len(rows) >= self.max_rows:
+                    break
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+
+            if rows:
+                try:
+                    async with get_writer() as db:
+                        await bulk_insert(db, INSERT_EVALUATION_SQL, rows, batch=self.max_rows)
+                    results = [None] * len(rows)
+                except Exception:
+                    results = await self._write_each(rows)
+                for future, error in zip(futures, results):
+                    if future.done():
+                        continue
+                    if error is None:
+                        future.set_result(None)
+                    else:
+                        future.set_exception(error)
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_result(None)
+
+    async def _write_each(self, rows: list) -> list:
+        """Insert rows one statement at a time; returns each row's error or None."""
+        try:
+            async with get_writer() as db:
+                # Check foreign keys per statement rather than at COMMIT, so
+                # a bad row aborts only its own INSERT
+                await db.execute("PRAGMA defer_foreign_keys = OFF")
+                results = []
+                for row in rows:
+                    try:
+                        await db.execute(INSERT_EVALUATION_SQL, row)
+                        results.append(None)
+                    except sqlite3.Error as e:
+                        results.append(e)
+                await db.commit()
+            return results
+        except Exception as e:
+            return [e] * len(rows)
+
+
+evaluation_writer = EvaluationWriter()
+
+
+async def fetch_all_dicts(
+    db: aiosqlite.Connection, sql: str, params: Iterable = ()
+) -> List[Dict[str, Any]]:
+    """Run a query and return every row as a dict keyed by column name.
+
+    Connections return plain tuples; zipping them with the column names once
+    per query is cheaper than building a name-addressable Row per row.
+    """
+    async with db.execute(sql, params) as cursor:
+        columns = [d[0] for d in cursor.description]
+        rows = await cursor.fetchall()
+    return [dict(zip(columns, row)) for row in rows]
+
+
+async def read_all(sql: str, params: Iterable = ()) -> List[tuple]:
+    """Run one query on its own pooled reader and return every row.
+
+    Independent queries issued through this can be awaited together with
+    asyncio.gather and execute concurrently on separate reader threads.
+    """
+    async with get_reader() as db:
+        async with db.execute(sql, params) as cursor:
+            return await cursor.fetchall()
+
+
+async def iter_dicts(
+    db: aiosqlite.Connection, sql: str, params: Iterable = ()
+) -> AsyncIterator[Dict[str, Any]]:
+    """Like fetch_all_dicts, but yield rows as the cursor produces them."""
+    async with db.execute(sql, params) as cursor:
+        columns = [d[0] for d in cursor.description]
+        async for row in cursor:
+            yield dict(zip(columns, row))
+
+
+def pack_raw_data(data: Any) -> bytes:
+    """Serialize a raw submission payload for submission_payloads.raw_data.
+
+    raw_data is archived, never queried, so it is kept as compressed JSON
+    rather than sqlite JSONB (which also needs sqlite >= 3.45). orjson emits
+    compact UTF-8 bytes directly, which keeps the encode cheap and the blob
+    small. A str is taken to be JSON text already (e.g. the payload's source
+    text from the upload) and is stored without re-serializing it.
+    """
+    if isinstance(data, str):
+        encoded = data.encode()
+    else:
+        encoded = orjson.dumps(data)
+    return zlib.compress(encoded, 3)
+
@@ -1,12 +1,25 @@
 from fastapi import FastAPI, UploadFile, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from typing import List, Optional
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from typing import List, Optional, Tuple
 from contextlib import asynccontextmanager
+from functools import lru_cache
+import asyncio
+import codecs
 import json
-from datetime import datetime
+import re
+import sqlite3
+import time
 import httpx
-
-from database import init_db, get_db
+import orjson
+from pydantic import TypeAdapter
+
+from database import (
+    init_db, close_db, get_reader, get_writer, bulk_insert, fetch_all_dicts,
+    iter_dicts, read_all, pack_raw_data,
+    INSERT_SUBMISSION_SQL, INSERT_PAYLOAD_SQL, INSERT_QUESTION_SQL,
+    INSERT_ANSWER_SQL, INSERT_ASSIGNMENT_SQL, evaluation_writer,
+)
 from models import (
     Submission, JudgeCreate, JudgeUpdate, JudgeResponse,
     JudgeAssignment, AssignmentResponse, EvaluationResponse,
@@ -14,7 +27,7 @@ from models import (
     QueueInfo, QuestionTemplate,
     ReviewItemResponse, HumanVerdictRequest, ReviewQueueStats,
 )
-from ollama_client import OllamaClient, parse_verdict
+from ollama_client import OllamaClient, VERDICT_FORMAT, parse_verdict
 from review import check_and_escalate, get_review_queue_items, get_review_item, submit_verdict, get_review_stats
 
 
@@ -22,8 +35,24 @@ from review import check_and_escalate, get_review_queue_items, get_review_item,
 async def lifespan(app: FastAPI):
     # Startup
     await init_db()
+    # Model schemas are built at import; the OpenAPI document is the one
+    # schema FastAPI builds lazily, so generate (and cache) it now
+    app.openapi()
     yield
-    # Shutdown (if needed in the future)
+    # Shutdown
+    await ollama_client.aclose()
+    await close_db()
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson, for routes that return plain dicts/lists.
+
+    Routes with a response_model already get serialized straight to bytes by
+    pydantic, so this is only applied where there is no model.
+    """
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
 
 
 app = FastAPI(title="GavelAI API", lifespan=lifespan)
@@ -42,57 +71,143 @@ ollama_client = OllamaClient()
 
 # ==================== Submissions Endpoints ====================
 
+# Uploads are parsed incrementally: the file is read UPLOAD_READ_SIZE bytes
+# at a time and rows are written every UPLOAD_BATCH_SIZE submissions, so
+# memory is bounded by the batch rather than by the size of the file.
+UPLOAD_READ_SIZE = 64 * 1024
+UPLOAD_BATCH_SIZE = 1000
+
+# Validates a whole batch of submissions in one pydantic-core call
+_SUBMISSIONS_ADAPTER = TypeAdapter(List[Submission])
+
+_JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+async def _iter_json_array(file: UploadFile):
+    """Yield (item, raw_text) for each element of the JSON array in `file`.
+
+    raw_text is the element's exact source text. Raises json.JSONDecodeError
+    for malformed JSON, like json.loads() on the whole file would.
+    """
+    decoder = json.JSONDecoder()
+    # Pick the encoding from the first bytes like json.loads(bytes) does:
+    # UTF-8, -16 or -32, with or without a BOM
+    head = await file.read(UPLOAD_READ_SIZE)
+    text_decoder = codecs.getincrementaldecoder(json.detect_encoding(head))()
+    eof = not head
+    buf, pos = text_decoder.decode(head, final=eof), 0
+    expect = "["  # then "item" / "item or ]", then ", or ]", then "end"
+    # After a partial element fails to decode, wait for the unparsed text to
+    # reach this length before retrying; doubling keeps huge elements linear
+    retry_len = 0
+    
+    while True:
+        pos = _JSON_WHITESPACE.match(buf, pos).end()
+        need_more = pos == len(buf)
+        if not need_more:
+            if expect == "[":
+                if buf[pos] != "[":
+                    # Not an array; parse the rest to tell bad JSON from wrong shape
+                    rest = await file.read()
+                    json.loads(buf[pos:] + text_decoder.decode(rest, final=True))
+                    raise HTTPException(status_code=400, detail="Expected JSON array")
+                pos += 1
+                expect = "item or ]"
+            elif expect == "item or ]" and buf[pos] == "]":
+                pos += 1
+                expect = "end"
+            elif expect in ("item", "item or ]"):
+                try:
+                    item, end = decoder.raw_decode(buf, pos)
+                    # A number at the end of the buffer may have been cut
+                    # short ("12" of "12.5"), so an element only counts as
+                    # complete once the delimiter after it has been read
+                    after = _JSON_WHITESPACE.match(buf, end).end()
+                    complete = eof or (after < len(buf) and buf[after] in ",]")
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                    complete = False  # element not fully read yet
+                if not complete:
+                    need_more = True
+                    retry_len = 2 * (len(buf) - pos)
+                else:
+                    yield item, buf[pos:end]
+                    pos = end
+                    expect = ", or ]"
+                    retry_len = 0
+            elif expect == ", or ]":
+                if buf[pos] not in ",]":
+                    raise json.JSONDecodeError("Expecting ',' delimiter", buf, pos)
+                expect = "item" if buf[pos] == "," else "end"
+                pos += 1
+            else:
+                raise json.JSONDecodeError("Extra data", buf, pos)
+        
+        if need_more:
+            if eof:
+                if expect == "end":
+                    return
+                raise json.JSONDecodeError("Expecting value", buf, pos)
+            chunks = [buf[pos:]]
+            size = len(chunks[0])
+            while True:
+                chunk = await file.read(UPLOAD_READ_SIZE)
+                eof = not chunk
+                text = text_decoder.decode(chunk, final=eof)
+                chunks.append(text)
+                size += len(text)
+                if eof or size >= retry_len:
+                    break
+            buf = "".join(chunks)
+            pos = 0
+
+
 @app.post("/api/submissions/upload")
 async def upload_submissions(file: UploadFile):
     """Upload and parse submissions JSON file."""
     try:
-        content = await file.read()
-        submissions_data = json.loads(content)
-        
-        if not isinstance(submissions_data, list):
-            raise HTTPException(status_code=400, detail="Expected JSON array")
-        
-        db = await get_db()
-        inserted_count = 0
-        
-        try:
-            for sub_data in submissions_data:
-                submission = Submission(**sub_data)
-                
-                # Insert submission
-                await db.execute(
-                    """INSERT OR REPLACE INTO submissions 
-                       (id, queue_id, labeling_task_id, created_at, raw_data)
-                       VALUES (?, ?, ?, ?, ?)""",
+        count = 0
+        pending = []  # (item, raw_text) pairs not yet validated and written
+        
+        async def write_batch(db):
+            submissions = _SUBMISSIONS_ADAPTER.validate_python([item for item, _ in pending])
+            submission_rows = []
+            payload_rows = []
+            question_rows = []
+            answer_rows = []
+            for submission, (_, raw_json) in zip(submissions, pending):
+                submission_rows.append(
                     (submission.id, submission.queueId, submission.labelingTaskId,
-                     submission.createdAt, json.dumps(sub_data))
+                     submission.createdAt)
                 )
-                
-                # Insert questions
+                payload_rows.append((submission.id, pack_raw_data(raw_json)))
                 for question in submission.questions:
-                    await db.execute(
-                        """INSERT INTO questions 
-                           (submission_id, question_template_id, question_type, question_text, content, rev)
-                           VALUES (?, ?, ?, ?, ?, ?)""",
+                    question_rows.append(
                         (submission.id, question.data.id, question.data.questionType,
                          question.data.questionText, question.data.content, question.rev)
                     )
-                
-                # Insert answers
                 for q_id, answer in submission.answers.items():
-                    await db.execute(
-                        """INSERT INTO answers 
-                           (submission_id, question_template_id, choice, reasoning)
-                           VALUES (?, ?, ?, ?)""",
-                        (submission.id, q_id, answer.choice, answer.reasoning)
-                    )
-                
-                inserted_count += 1
+                    answer_rows.append((submission.id, q_id, answer.choice, answer.reasoning))
+            await bulk_insert(db, INSERT_SUBMISSION_SQL, submission_rows, commit=False)
+            await bulk_insert(db, INSERT_PAYLOAD_SQL, payload_rows, commit=False)
+            await bulk_insert(db, INSERT_QUESTION_SQL, question_rows, commit=False)
+            await bulk_insert(db, INSERT_ANSWER_SQL, answer_rows, commit=False)
+            pending.clear()
+        
+        # All batches share one transaction: a bad record anywhere in the file
+        # rolls the whole upload back
+        async with get_writer() as db:
+            async for item in _iter_json_array(file):
+                pending.append(item)
+                count += 1
+                if len(pending) >= UPLOAD_BATCH_SIZE:
+                    await write_batch(db)
             
+            await write_batch(db)
             await db.commit()
-            return {"message": f"Successfully uploaded {inserted_count} submissions"}
-        finally:
-            await db.close()
+        
+        return {"message": f"Successfully uploaded {count} submissions"}
     
     except json.JSONDecodeError:
         raise HTTPException(status_code=400, detail="Invalid JSON format")
@@ -100,105 +215,47 @@ async def upload_submissions(file: UploadFile):
         raise HTTPException(status_code=500, detail=f"Error processing file: {str(e)}")
 
 
-@app.get("/api/queues")
+@app.get("/api/queues", response_class=ORJSONResponse)
 async def get_queues():
     """Get all queues with submission counts."""
-    db = await get_db()
-    try:
-        cursor = await db.execute("""
-            SELECT queue_id, COUNT(*) as count, MIN(created_at) as first_uploaded
+    async with get_reader() as db:
+        return await fetch_all_dicts(db, """
+            SELECT queue_id, COUNT(*) AS submission_count, MIN(created_at) AS uploaded_at
             FROM submissions
             GROUP BY queue_id
-            ORDER BY first_uploaded DESC
+            ORDER BY uploaded_at DESC
         """)
-        rows = await cursor.fetchall()
-        queues = [{"queue_id": row[0], "submission_count": row[1], "uploaded_at": row[2]} for row in rows]
-        return queues
-    finally:
-        await db.close()
 
 
-@app.get("/api/queues/{queue_id}/submissions")
+@app.get("/api/queues/{queue_id}/submissions", response_class=ORJSONResponse)
 async def get_queue_submissions(queue_id: str):
     """Get all submissions in a queue with their details."""
-    db = await get_db()
-    try:
-        cursor = await db.execute("""
-            SELECT id, labeling_task_id, created_at
-            FROM submissions
-            WHERE queue_id = ?
-            ORDER BY created_at DESC
+    async with get_reader() as db:
+        # Correlated counts: each one is a range scan of the questions primary
+        # key / idx_evaluations_sub_q for just this queue's submissions
+        return await fetch_all_dicts(db, """
+            SELECT s.id, s.labeling_task_id, s.created_at,
+                   (SELECT COUNT(*) FROM questions q
+                    WHERE q.submission_id = s.id) AS question_count,
+                   (SELECT COUNT(*) FROM evaluations e
+                    WHERE e.submission_id = s.id) AS evaluation_count
+            FROM submissions s
+            WHERE s.queue_id = ?
+            ORDER BY s.created_at DESC
         """, (queue_id,))
-        rows = await cursor.fetchall()
-        
-        if not rows:
-            return []
-        
-        submissions = []
-        for row in rows:
-            sub_id = row[0]
-            
-            # Count questions for this submission
-            cursor2 = await db.execute(
-                "SELECT COUNT(*) FROM questions WHERE submission_id = ?",
-                (sub_id,)
-            )
-            question_count = (await cursor2.fetchone())[0]
-            
-            # Count evaluations for this submission
-            cursor3 = await db.execute(
-                "SELECT COUNT(*) FROM evaluations WHERE submission_id = ?",
-                (sub_id,)
-            )
-            evaluation_count = (await cursor3.fetchone())[0]
-            
-            submissions.append({
-                "id": sub_id,
-                "labeling_task_id": row[1],
-                "created_at": row[2],
-                "question_count": question_count,
-                "evaluation_count": evaluation_count
-            })
-        
-        return submissions
-    finally:
-        await db.close()
 
 
 @app.delete("/api/queues/{queue_id}")
 async def delete_queue(queue_id: str):
     """Delete a queue and all its associated data."""
-    db = await get_db()
-    try:
-        # Get submission IDs for this queue
-        cursor = await db.execute(
-            "SELECT id FROM submissions WHERE queue_id = ?",
-            (queue_id,)
-        )
-        submission_rows = await cursor.fetchall()
-        submission_ids = [row[0] for row in submission_rows]
-        
-        if not submission_ids:
-            raise HTTPException(status_code=404, detail="Queue not found")
-        
-        # Delete evaluations for these submissions
-        placeholders = ','.join('?' * len(submission_ids))
-        await db.execute(
-            f"DELETE FROM evaluations WHERE submission_id IN ({placeholders})",
-            submission_ids
-        )
-        
-        # Delete answers for these submissions
-        await db.execute(
-            f"DELETE FROM answers WHERE submission_id IN ({placeholders})",
-            submission_ids
-        )
-        
-        # Delete questions for these submissions
-        await db.execute(
-            f"DELETE FROM questions WHERE submission_id IN ({placeholders})",
-            submission_ids
-        )
+    async with get_writer() as db:
+        # Children first: each one finds the queue's submissions by subquery
+        for table in ("evaluations", "review_queue", "answers", "questions", "submission_payloads"):
+            await db.execute(
+                f"""DELETE FROM {table}
+                    WHERE submission_id IN (SELECT id FROM submissions WHERE queue_id = ?)""",
+                (queue_id,)
+            )
         
         # Delete judge assignments for this queue
         await db.execute(
@@ -206,128 +263,102 @@ async def delete_queue(queue_id: str):
             (queue_id,)
         )
         
-        # Delete submissions
-        await db.execute(
+        # Delete submissions. If there were none the queue doesn't exist, and
+        # raising inside the block rolls back the deletes above
+        cursor = await db.execute(
             "DELETE FROM submissions WHERE queue_id = ?",
             (queue_id,)
         )
+        if cursor.rowcount == 0:
+            raise HTTPException(status_code=404, detail="Queue not found")
         
         await db.commit()
         return {"message": f"Queue '{queue_id}' and all associated data deleted successfully"}
-    finally:
-        await db.close()
 
 
-@app.get("/api/queues/{queue_id}/questions")
+@app.get("/api/queues/{queue_id}/questions", response_class=ORJSONResponse)
 async def get_queue_questions(queue_id: str):
     """Get all unique question templates in a queue with assigned judges and sample answers."""
-    db = await get_db()
-    try:
-        # Get unique questions
-        cursor = await db.execute("""
+    # The three lookups are independent, so each runs on its own reader
+    rows, assignment_rows, answer_rows = await asyncio.gather(
+        # Unique questions
+        read_all("""
             SELECT DISTINCT q.question_template_id, q.question_text, q.question_type, q.content
             FROM questions q
             JOIN submissions s ON q.submission_id = s.id
             WHERE s.queue_id = ?
-        """, (queue_id,))
-        rows = await cursor.fetchall()
-        
-        questions = []
-        for row in rows:
-            q_template_id = row[0]
-            
-            # Get assigned judges for this question
-            cursor2 = await db.execute("""
-                SELECT judge_id
-                FROM judge_assignments
-                WHERE queue_id = ? AND question_template_id = ?
-            """, (queue_id, q_template_id))
-            judge_rows = await cursor2.fetchall()
-            judge_ids = [r[0] for r in judge_rows]
-            
-            # Get the answer for this question template
-            cursor3 = await db.execute("""
-                SELECT a.choice, a.reasoning
-                FROM answers a
-                JOIN submissions s ON a.submission_id = s.id
-                WHERE s.queue_id = ? AND a.question_template_id = ?
-                LIMIT 1
-            """, (queue_id, q_template_id))
-            answer_row = await cursor3.fetchone()
-            answer = {"choice": answer_row[0], "reasoning": answer_row[1]} if answer_row else None
-            
-            questions.append({
-                "question_template_id": q_template_id,
-                "question_text": row[1],
-                "question_type": row[2],
-                "content": row[3],
-                "assigned_judge_ids": judge_ids,
-                "answer": answer
-            })
-        
-        return questions
-    finally:
-        await db.close()
+        """, (queue_id,)),
+        # Assigned judges for every question of the queue
+        read_all("""
+            SELECT question_template_id, judge_id
+            FROM judge_assignments
+            WHERE queue_id = ?
+        """, (queue_id,)),
+        # One sample answer per question template: the first one found
+        read_all("""
+            SELECT a.question_template_id, a.choice, a.reasoning
+            FROM submissions s
+            JOIN answers a ON a.submission_id = s.id
+            WHERE s.queue_id = ?
+        """, (queue_id,)),
+    )
+    
+    judge_ids: dict = {}
+    for q_template_id, judge_id in assignment_rows:
+        judge_ids.setdefault(q_template_id, []).append(judge_id)
+    
+    answers: dict = {}
+    for q_template_id, choice, reasoning in answer_rows:
+        answers.setdefault(q_template_id, {"choice": choice, "reasoning": reasoning})
+    
+    return [
+        {
+            "question_template_id": row[0],
+            "question_text": row[1],
+            "question_type": row[2],
+            "content": row[3],
+            "assigned_judge_ids": judge_ids.get(row[0], []),
+            "answer": answers.get(row[0]),
+        }
+        for row in rows
+    ]
 
 
 # ==================== Judges Endpoints ====================
 
+JUDGE_COLUMNS = "id, name, system_prompt, model_name, active, created_at"
+
+
 @app.post("/api/judges", response_model=JudgeResponse)
 async def create_judge(judge: JudgeCreate):
     """Create a new GavelAI judge."""
-    db = await get_db()
-    try:
-        created_at = datetime.now().isoformat()
-        cursor = await db.execute(
-            """INSERT INTO judges (name, system_prompt, model_name, active, created_at)
-               VALUES (?, ?, ?, ?, ?)""",
-            (judge.name, judge.system_prompt, judge.model_name, judge.active, created_at)
-        )
-        await db.commit()
-        judge_id = cursor.lastrowid
-        
-        return JudgeResponse(
-            id=judge_id,
-            name=judge.name,
-            system_prompt=judge.system_prompt,
-            model_name=judge.model_name,
-            active=judge.active,
-            created_at=created_at
-        )
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Error creating judge: {str(e)}")
-    finally:
-        await db.close()
+    async with get_writer() as db:
+        try:
+            created_at = int(time.time() * 1000)
+            rows = await fetch_all_dicts(
+                db,
+                f"""INSERT INTO judges (name, system_prompt, model_name, active, created_at)
+                    VALUES (?, ?, ?, ?, ?)
+                    RETURNING {JUDGE_COLUMNS}""",
+                (judge.name, judge.system_prompt, judge.model_name, judge.active, created_at)
+            )
+            await db.commit()
+            return JudgeResponse(**rows[0])
+        except Exception as e:
+            raise HTTPException(status_code=400, detail=f"Error creating judge: {str(e)}")
 
 
 @app.get("/api/judges", response_model=List[JudgeResponse])
 async def get_judges():
     """Get all judges."""
-    db = await get_db()
-    try:
-        cursor = await db.execute("SELECT * FROM judges ORDER BY created_at DESC")
-        rows = await cursor.fetchall()
-        
-        return [
-            JudgeResponse(
-                id=row[0],
-                name=row[1],
-                system_prompt=row[2],
-                model_name=row[3],
-                active=bool(row[4]),
-                created_at=row[5]
-            )
-            for row in rows
-        ]
-    finally:
-        await db.close()
+    async with get_reader() as db:
+        return await fetch_all_dicts(db, "SELECT * FROM judges ORDER BY created_at DESC")
 
 
 @app.get("/api/judges/{judge_id}", response_model=JudgeResponse)
 async def get_judge(judge_id: int):
     """Get a specific judge."""
-    db = await get_db()
-    try:
+    async with get_reader() as db:
         cursor = await db.execute("SELECT * FROM judges WHERE id = ?", (judge_id,))
         row = await cursor.fetchone()
         
@@ -342,22 +373,12 @@ async def get_judge(judge_id: int):
             active=bool(row[4]),
             created_at=row[5]
         )
-    finally:
-        await db.close()
 
 
 @app.put("/api/judges/{judge_id}", response_model=JudgeResponse)
 async def update_judge(judge_id: int, judge_update: JudgeUpdate):
     """Update a judge."""
-    db = await get_db()
-    try:
-        # Get existing judge
-        cursor = await db.execute("SELECT * FROM judges WHERE id = ?", (judge_id,))
-        row = await cursor.fetchone()
-        
-        if not row:
-            raise HTTPException(status_code=404, detail="Judge not found")
-        
+    async with get_writer() as db:
         # Build update query
         updates = []
         params = []
@@ -375,13 +396,21 @@ async def update_judge(judge_id: int, judge_update: JudgeUpdate):
             updates.append("active = ?")
             params.append(judge_update.active)
         
+        # RETURNING hands back the post-update row, so no re-SELECT is needed
         if updates:
             params.append(judge_id)
-            await db.execute(
-                f"UPDATE judges SET {', '.join(updates)} WHERE id = ?",
+            rows = await fetch_all_dicts(
+                db,
+                f"UPDATE judges SET {', '.join(updates)} WHERE id = ? RETURNING {JUDGE_COLUMNS}",
                 params
             )
-            await db.commit()
+        else:
+            rows = await fetch_all_dicts(
+                db, f"SELECT {JUDGE_COLUMNS} FROM judges WHERE id = ?", (judge_id,)
+            )
+        
+        if not rows:
+            raise HTTPException(status_code=404, detail="Judge not found")
         
         # If judge is being deactivated, remove all assignments
         if judge_update.active is not None and judge_update.active is False:
@@ -389,34 +418,20 @@ async def update_judge(judge_id: int, judge_update: JudgeUpdate):
                 "DELETE FROM judge_assignments WHERE judge_id = ?",
                 (judge_id,)
             )
-            await db.commit()
         
-        # Return updated judge
-        cursor = await db.execute("SELECT * FROM judges WHERE id = ?", (judge_id,))
-        row = await cursor.fetchone()
-        
-        return JudgeResponse(
-            id=row[0],
-            name=row[1],
-            system_prompt=row[2],
-            model_name=row[3],
-            active=bool(row[4]),
-            created_at=row[5]
-        )
-    finally:
-        await db.close()
+        await db.commit()
+        return JudgeResponse(**rows[0])
 
 
 @app.delete("/api/judges/{judge_id}")
 async def delete_judge(judge_id: int):
-    """Delete a judge."""
-    db = await get_db()
-    try:
+    """Delete a judge along with its assignments and evaluations."""
+    async with get_writer() as db:
+        await db.execute("DELETE FROM judge_assignments WHERE judge_id = ?", (judge_id,))
+        await db.execute("DELETE FROM evaluations WHERE judge_id = ?", (judge_id,))
         await db.execute("DELETE FROM judges WHERE id = ?", (judge_id,))
         await db.commit()
         return {"message": "Judge deleted successfully"}
-    finally:
-        await db.close()
 
 
 # ==================== Judge Assignments Endpoints ====================
@@ -424,8 +439,7 @@ async def delete_judge(judge_id: int):
 @app.post("/api/assignments")
 async def assign_judges(assignment: JudgeAssignment):
     """Assign judges to a question in a queue."""
-    db = await get_db()
-    try:
+    async with get_writer() as db:
         # Delete existing assignments for this question in queue
         await db.execute(
             """DELETE FROM judge_assignments 
@@ -433,104 +447,37 @@ async def assign_judges(assignment: JudgeAssignment):
             (assignment.queue_id, assignment.question_template_id)
         )
         
-        # Insert new assignments
-        created_at = datetime.now().isoformat()
-        for judge_id in assignment.judge_ids:
-            await db.execute(
-                """INSERT INTO judge_assignments 
-                   (queue_id, question_template_id, judge_id, created_at)
-                   VALUES (?, ?, ?, ?)""",
-                (assignment.queue_id, assignment.question_template_id, judge_id, created_at)
+        # Insert new assignments in one executemany; OR IGNORE drops
+        # repeated judge ids instead of tripping the UNIQUE constraint
+        created_at = int(time.time() * 1000)
+        try:
+            await bulk_insert(
+                db,
+                INSERT_ASSIGNMENT_SQL,
+                [(assignment.queue_id, assignment.question_template_id, judge_id, created_at)
+                 for judge_id in assignment.judge_ids],
             )
-        
-        await db.commit()
+        except sqlite3.IntegrityError:
+            raise HTTPException(status_code=400, detail="Unknown judge ID in judge_ids")
         return {"message": "Judges assigned successfully"}
-    finally:
-        await db.close()
 
 
 # ==================== Evaluations Endpoints ====================
 
-@app.post("/api/evaluations/run", response_model=RunEvaluationResponse)
-async def run_evaluations(request: RunEvaluationRequest):
-    """Run GavelAI judges on all submissions in a queue."""
-    db = await get_db()
-    planned = 0
-    completed = 0
-    failed = 0
-    escalated = 0
-    errors = []
-    
-    try:
-        # Get all submissions in queue
-        cursor = await db.execute(
-            "SELECT id FROM submissions WHERE queue_id = ?",
-            (request.queue_id,)
-        )
-        submission_rows = await cursor.fetchall()
-        submission_ids = [row[0] for row in submission_rows]
-        
-        for sub_id in submission_ids:
-            # Get questions for this submission
-            cursor = await db.execute(
-                """SELECT question_template_id, question_text, content 
-                   FROM questions WHERE submission_id = ?""",
-                (sub_id,)
-            )
-            question_rows = await cursor.fetchall()
-            
-            for q_row in question_rows:
-                q_template_id = q_row[0]
-                q_text = q_row[1]
-                q_content = q_row[2]  # Per-question context (may be None)
-                
-                # Get assigned judges
-                cursor = await db.execute(
-                    """SELECT j.id, j.name, j.system_prompt, j.model_name
-                       FROM judges j
-                       JOIN judge_assignments ja ON j.id = ja.judge_id
-                       WHERE ja.queue_id = ? AND ja.question_template_id = ?
-                       AND j.active = 1""",
-                    (request.queue_id, q_template_id)
-                )
-                judge_rows = await cursor.fetchall()
-                
-                # Get answer
-                cursor = await db.execute(
-                    """SELECT choice, reasoning FROM answers
-                       WHERE submission_id = ? AND question_template_id = ?""",
-                    (sub_id, q_template_id)
-                )
-                answer_row = await cursor.fetchone()
-                
-                if not answer_row:
-                    continue
-                
-                answer_text = f"Choice: {answer_row[0]}"
-                if answer_row[1]:
-                    answer_text += f"\nReasoning: {answer_row[1]}"
-                
-                # Run each judge
-                for judge_row in judge_rows:
-                    planned += 1
-                    judge_id = judge_row[0]
-                    judge_name = judge_row[1]
-                    system_prompt = judge_row[2]
-                    model_name = judge_row[3]
-                    
-                    try:
-                        # Build prompt with optional content context
-                        context_section = ""
-                        if q_content:
-                            context_section = f"""
+# Evaluation prompt. Only the context, question and answer change between
+# prompts, so the fixed rubric is built once here and filled in with
+# str.format (literal braces are doubled). CONTEXT_TEMPLATE is prepended
+# when a question has content. The response format described at the end
+# matches VERDICT_FORMAT, the JSON schema the judge calls are constrained to.
+CONTEXT_TEMPLATE = """
 === CONTEXT ===
 The following is the source material that the question and answer refer to. You MUST use this context to verify the accuracy of the answer. Do not evaluate the answer in isolation — ground your judgment in the specific details provided here.
 
-{q_content}
+{content}
 
 """
-                        
-                        prompt = f"""{context_section}=== QUESTION BEING EVALUATED ===
+
+PROMPT_TEMPLATE = """{context}=== QUESTION BEING EVALUATED ===
 {q_text}
 
 === HUMAN ANALYST'S ANSWER ===
@@ -550,123 +497,227 @@ IMPORTANT RULES:
 - If there is insufficient context to make a determination, verdict should be INCONCLUSIVE.
 - Be precise in your reasoning — cite specific values, thresholds, or code patterns from the context.
 
-Respond in EXACTLY this format (three lines, no extra text):
-VERDICT: pass|fail|inconclusive
-REASONING: [Your detailed explanation citing specific evidence from the context]
-CONFIDENCE: [0-100, where 100 means absolute certainty in your verdict]"""
-                        
-                        # Call Ollama
-                        response = await ollama_client.generate(
-                            model=model_name,
-                            prompt=prompt,
-                            system=system_prompt
-                        )
-                        
-                        # Parse verdict
-                        verdict, reasoning, confidence = parse_verdict(response)
-                        
-                        # Store evaluation
-                        created_at = datetime.now().isoformat()
-                        await db.execute(
-                            """INSERT INTO evaluations 
-                               (submission_id, question_template_id, judge_id, verdict, reasoning, confidence_score, created_at)
-                               VALUES (?, ?, ?, ?, ?, ?, ?)""",
-                            (sub_id, q_template_id, judge_id, verdict, reasoning, confidence, created_at)
-                        )
-                        await db.commit()
-                        completed += 1
-                        
-                    except httpx.HTTPError as e:
-                        failed += 1
-                        error_msg = f"HTTP error for judge '{judge_name}': {str(e)}"
-                        errors.append(error_msg)
-                    except Exception as e:
-                        failed += 1
-                        error_msg = f"Error running judge '{judge_name}': {str(e)}"
-                        errors.append(error_msg)
-                
-                # After all judges for this (submission, question) pair, check escalation
-                try:
-                    was_escalated = await check_and_escalate(db, sub_id, q_template_id)
-                    if was_escalated:
-                        escalated += 1
-                except Exception:
-                    pass
-        
-        return RunEvaluationResponse(
-            planned=planned,
-            completed=completed,
-            failed=failed,
-            escalated=escalated,
-            errors=errors[:10]  # Limit error messages
+Respond with ONLY a JSON object with exactly these three keys (no extra text):
+{{
+  "verdict": "pass" | "fail" | "inconclusive",
+  "reasoning": "<your detailed explanation citing specific evidence from the context>",
+  "confidence": <integer 0-100, where 100 means absolute certainty in your verdict>
+}}"""
+
+
+@app.post("/api/evaluations/run", response_model=RunEvaluationResponse)
+async def run_evaluations(request: RunEvaluationRequest):
+    """Run GavelAI judges on all submissions in a queue."""
+    completed = 0
+    failed = 0
+    escalated = 0
+    errors = []
+    
+    # Plan every (submission, question) pair with its prompt and judges
+    # before calling Ollama, so the reader goes back to the pool right away
+    pairs = {}
+    async with get_reader() as db:
+        # One row per (submission, question, active judge) that has an answer;
+        # pairs without an active judge still come back (judge columns NULL)
+        # so their escalation is re-checked like before
+        cursor = await db.execute(
+            """SELECT s.id, q.question_template_id, q.question_text, q.content,
+                      a.choice, a.reasoning,
+                      aa.judge_id, aa.name, aa.system_prompt, aa.model_name
+               FROM submissions s
+               JOIN questions q ON q.submission_id = s.id
+               JOIN answers a ON a.submission_id = s.id
+                             AND a.question_template_id = q.question_template_id
+               LEFT JOIN active_assignments aa
+                      ON aa.queue_id = s.queue_id
+                     AND aa.question_template_id = q.question_template_id
+               WHERE s.queue_id = ?""",
+            (request.queue_id,)
         )
-    finally:
-        await db.close()
+        task_rows = await cursor.fetchall()
+    
+    for row in task_rows:
+        sub_id, q_template_id = row[0], row[1]
+        pair = pairs.get((sub_id, q_template_id))
+        if pair is None:
+            q_text = row[2]
+            q_content = row[3]  # Per-question context (may be None)
+            
+            answer_text = f"Choice: {row[4]}"
+            if row[5]:
+                answer_text += f"\nReasoning: {row[5]}"
+            
+            # Build prompt with optional content context
+            context_section = CONTEXT_TEMPLATE.format(content=q_content) if q_content else ""
+            prompt = PROMPT_TEMPLATE.format(
+                context=context_section, q_text=q_text, answer_text=answer_text
+            )
+            
+            pair = pairs[(sub_id, q_template_id)] = (sub_id, q_template_id, prompt, [])
+        if row[6] is not None:
+            pair[3].append(row[6:])
+    
+    # Judges run concurrently; the semaphore caps in-flight Ollama calls
+    semaphore = asyncio.Semaphore(request.concurrency)
+    
+    async def run_judge(sub_id, q_template_id, prompt, judge_row):
+        nonlocal completed, failed
+        judge_id, judge_name, system_prompt, model_name = judge_row
+        try:
+            # Call Ollama
+            async with semaphore:
+                response = await ollama_client.generate(
+                    model=model_name,
+                    prompt=prompt,
+                    system=system_prompt,
+                    format=VERDICT_FORMAT
+                )
+            
+            # Parse verdict
+            verdict, reasoning, confidence = parse_verdict(response)
+            
+            # Store evaluation (batched by the background writer) and wait
+            # for its commit, so completed only counts stored verdicts
+            created_at = int(time.time() * 1000)
+            written = await evaluation_writer.submit(
+                (sub_id, q_template_id, judge_id, verdict, reasoning, confidence, created_at)
+            )
+            try:
+                await written
+            except Exception as e:
+                failed += 1
+                errors.append(f"Failed to store evaluation from judge '{judge_name}': {str(e)}")
+                return
+            completed += 1
+            
+        except httpx.HTTPError as e:
+            failed += 1
+            error_msg = f"HTTP error for judge '{judge_name}': {str(e)}"
+            errors.append(error_msg)
+        except Exception as e:
+            failed += 1
+            error_msg = f"Error running judge '{judge_name}': {str(e)}"
+            errors.append(error_msg)
+    
+    planned = sum(len(pair[3]) for pair in pairs.values())
+    await asyncio.gather(*(
+        run_judge(sub_id, q_template_id, prompt, judge_row)
+        for sub_id, q_template_id, prompt, judge_rows in pairs.values()
+        for judge_row in judge_rows
+    ))
+    
+    # After all judges have run, check escalation for every (submission,
+    # question) pair. Each judge waited for its own row's commit, so every
+    # stored evaluation is visible here; rows that failed were counted above.
+    async with get_writer() as writer_db:
+        for sub_id, q_template_id in pairs:
+            try:
+                if await check_and_escalate(writer_db, sub_id, q_template_id):
+                    escalated += 1
+            except Exception:
+                await writer_db.rollback()
+    
+    return RunEvaluationResponse(
+        planned=planned,
+        completed=completed,
+        failed=failed,
+        escalated=escalated,
+        errors=errors[:10]  # Limit error messages
+    )
+
+
+@lru_cache(maxsize=256)
+def _parse_ids(csv: str, as_int: bool) -> tuple:
+    """Split a comma-separated id filter. Cached: clients repeat the same filters."""
+    return tuple(int(x) if as_int else x.strip() for x in csv.split(','))
+
+
+def _build_eval_filters(
+    judge_ids: Optional[str],
+    question_ids: Optional[str],
+    verdict: Optional[str],
+    prefix: str = "",
+) -> Tuple[str, list]:
+    """Build the evaluation filter clauses (each starting with AND) and their params.
+
+    `prefix` is the evaluations table alias including the dot, e.g. "e.".
+    """
+    sql = ""
+    params: list = []
+    
+    if judge_ids:
+        try:
+            ids = _parse_ids(judge_ids, True)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="judge_ids must be comma-separated integers")
+        placeholders = ','.join('?' * len(ids))
+        sql += f" AND {prefix}judge_id IN ({placeholders})"
+        params.extend(ids)
+    
+    if question_ids:
+        ids = _parse_ids(question_ids, False)
+        placeholders = ','.join('?' * len(ids))
+        sql += f" AND {prefix}question_template_id IN ({placeholders})"
+        params.extend(ids)
+    
+    if verdict:
+        sql += f" AND {prefix}verdict = ?"
+        params.append(verdict)
+    
+    return sql, params
+
+
+_EVALUATIONS_ADAPTER = TypeAdapter(List[EvaluationResponse])
 
 
 @app.get("/api/evaluations", response_model=List[EvaluationResponse])
 async def get_evaluations(
     judge_ids: Optional[str] = Query(None),
     question_ids: Optional[str] = Query(None),
-    verdict: Optional[str] = Query(None)
+    verdict: Optional[str] = Query(None),
+    stream: bool = Query(False)
 ):
-    """Get evaluations with optional filters."""
-    db = await get_db()
-    try:
-        query = """
-            SELECT e.id, e.submission_id, e.question_template_id, e.judge_id,
-                   j.name as judge_name, e.verdict, e.reasoning, e.confidence_score,
-                   e.created_at, q.question_text, a.choice, a.reasoning
-            FROM evaluations e
-            JOIN judges j ON e.judge_id = j.id
-            LEFT JOIN questions q ON e.submission_id = q.submission_id 
-                                 AND e.question_template_id = q.question_template_id
-            LEFT JOIN answers a ON e.submission_id = a.submission_id
-                                AND e.question_template_id = a.question_template_id
-            WHERE 1=1
-        """
-        params = []
-        
-        if judge_ids:
-            ids = [int(id.strip()) for id in judge_ids.split(',')]
-            placeholders = ','.join('?' * len(ids))
-            query += f" AND e.judge_id IN ({placeholders})"
-            params.extend(ids)
-        
-        if question_ids:
-            ids = [id.strip() for id in question_ids.split(',')]
-            placeholders = ','.join('?' * len(ids))
-            query += f" AND e.question_template_id IN ({placeholders})"
-            params.extend(ids)
-        
-        if verdict:
-            query += " AND e.verdict = ?"
-            params.append(verdict)
-        
-        query += " ORDER BY e.created_at DESC LIMIT 1000"
-        
-        cursor = await db.execute(query, params)
-        rows = await cursor.fetchall()
-        
-        return [
-            EvaluationResponse(
-                id=row[0],
-                submission_id=row[1],
-                question_template_id=row[2],
-                judge_id=row[3],
-                judge_name=row[4],
-                verdict=row[5],
-                reasoning=row[6],
-                confidence_score=row[7],
-                created_at=row[8],
-                question_text=row[9],
-                answer_choice=row[10],
-                answer_reasoning=row[11]
-            )
-            for row in rows
-        ]
-    finally:
-        await db.close()
+    """Get evaluations with optional filters.
+
+    With stream=true the rows are sent as NDJSON while they are read instead
+    of being collected into one JSON array.
+    """
+    query = """
+        SELECT e.id, e.submission_id, e.question_template_id, e.judge_id,
+               j.name AS judge_name, e.verdict, e.reasoning, e.confidence_score,
+               e.created_at, q.question_text, a.choice AS answer_choice,
+               a.reasoning AS answer_reasoning
+        FROM evaluations e
+        JOIN judges j ON e.judge_id = j.id
+        LEFT JOIN questions q ON e.submission_id = q.submission_id 
+                             AND e.question_template_id = q.question_template_id
+        LEFT JOIN answers a ON e.submission_id = a.submission_id
+                            AND e.question_template_id = a.question_template_id
+        WHERE 1=1
+    """
+    filters, params = _build_eval_filters(judge_ids, question_ids, verdict, prefix="e.")
+    query += filters + " ORDER BY e.created_at DESC LIMIT 1000"
+    
+    if stream:
+        return StreamingResponse(
+            _stream_evaluations(query, params), media_type="application/x-ndjson"
+        )
+    
+    async with get_reader() as db:
+        rows = await fetch_all_dicts(db, query, params)
+    # Validated and encoded by a module-level adapter straight to JSON bytes;
+    # response_model above only documents the shape
+    return Response(
+        _EVALUATIONS_ADAPTER.dump_json(_EVALUATIONS_ADAPTER.validate_python(rows)),
+        media_type="application/json",
+    )
+
+
+async def _stream_evaluations(query: str, params: list):
+    # Borrows its own reader: the body is produced after the handler returns
+    async with get_reader() as db:
+        async for row in iter_dicts(db, query, params):
+            yield EvaluationResponse(**row).model_dump_json() + "\n"
 
 
 @app.get("/api/evaluations/stats", response_model=EvaluationStats)
@@ -676,140 +727,62 @@ async def get_evaluation_stats(
     verdict: Optional[str] = Query(None)
 ):
     """Get evaluation statistics with optional filters."""
-    db = await get_db()
-    try:
-        query = """
-            SELECT verdict, COUNT(*) as count
+    async with get_reader() as db:
+        filters, params = _build_eval_filters(judge_ids, question_ids, verdict)
+        cursor = await db.execute(f"""
+            SELECT COUNT(*),
+                   SUM(verdict = 'pass'),
+                   SUM(verdict = 'fail'),
+                   SUM(verdict = 'inconclusive'),
+                   AVG(confidence_score)
             FROM evaluations
-            WHERE 1=1
-        """
-        params = []
-        
-        if judge_ids:
-            ids = [int(id.strip()) for id in judge_ids.split(',')]
-            placeholders = ','.join('?' * len(ids))
-            query += f" AND judge_id IN ({placeholders})"
-            params.extend(ids)
-        
-        if question_ids:
-            ids = [id.strip() for id in question_ids.split(',')]
-            placeholders = ','.join('?' * len(ids))
-            query += f" AND question_template_id IN ({placeholders})"
-            params.extend(ids)
-        
-        if verdict:
-            query += " AND verdict = ?"
-            params.append(verdict)
-        
-        query += " GROUP BY verdict"
-        
-        cursor = await db.execute(query, params)
-        rows = await cursor.fetchall()
-        
-        stats = {"pass": 0, "fail": 0, "inconclusive": 0}
-        for row in rows:
-            stats[row[0]] = row[1]
-        
-        total = sum(stats.values())
-        pass_rate = (stats["pass"] / total * 100) if total > 0 else 0.0
-        
-        # Calculate average confidence
-        avg_query = "SELECT AVG(confidence_score) FROM evaluations WHERE 1=1"
-        avg_params = []
-        if judge_ids:
-            ids = [int(id.strip()) for id in judge_ids.split(',')]
-            placeholders = ','.join('?' * len(ids))
-            avg_query += f" AND judge_id IN ({placeholders})"
-            avg_params.extend(ids)
-        if question_ids:
-            ids = [id.strip() for id in question_ids.split(',')]
-            placeholders = ','.join('?' * len(ids))
-            avg_query += f" AND question_template_id IN ({placeholders})"
-            avg_params.extend(ids)
-        if verdict:
-            avg_query += " AND verdict = ?"
-            avg_params.append(verdict)
+            WHERE 1=1{filters}
+        """, params)
+        total, pass_count, fail_count, inconclusive_count, avg = await cursor.fetchone()
         
-        avg_cursor = await db.execute(avg_query, avg_params)
-        avg_row = await avg_cursor.fetchone()
-        avg_confidence = round(float(avg_row[0]), 1) if avg_row and avg_row[0] is not None else 50.0
+        # SUM() is NULL when no rows match
+        pass_count = pass_count or 0
+        pass_rate = (pass_count / total * 100) if total > 0 else 0.0
+        avg_confidence = round(float(avg), 1) if avg is not None else 50.0
         
         return EvaluationStats(
             total=total,
-            pass_count=stats["pass"],
-            fail_count=stats["fail"],
-            inconclusive_count=stats["inconclusive"],
+            pass_count=pass_count,
+            fail_count=fail_count or 0,
+            inconclusive_count=inconclusive_count or 0,
             pass_rate=round(pass_rate, 2),
             avg_confidence=avg_confidence
         )
-    finally:
-        await db.close()
 
 
-@app.get("/api/evaluations/stats/by-queue")
+@app.get("/api/evaluations/stats/by-queue", response_class=ORJSONResponse)
 async def get_queue_stats():
     """Get evaluation statistics grouped by queue and judge."""
-    db = await get_db()
-    try:
-        # Get stats by queue and judge
-        query = """
+    async with get_reader() as db:
+        # One row per (queue, judge) with the verdict counts pivoted in SQL
+        rows = await fetch_all_dicts(db, """
             SELECT 
                 s.queue_id,
                 e.judge_id,
                 j.name as judge_name,
-                e.verdict,
-                COUNT(*) as count
+                SUM(e.verdict = 'pass') as "pass",
+                SUM(e.verdict = 'fail') as "fail",
+                SUM(e.verdict = 'inconclusive') as inconclusive,
+                COUNT(*) as total,
+                ROUND(100.0 * SUM(e.verdict = 'pass') / COUNT(*), 2) as pass_rate
             FROM evaluations e
             JOIN judges j ON e.judge_id = j.id
             JOIN submissions s ON e.submission_id = s.id
-            GROUP BY s.queue_id, e.judge_id, j.name, e.verdict
-            ORDER BY s.queue_id, e.judge_id, e.verdict
-        """
-        
-        cursor = await db.execute(query)
-        rows = await cursor.fetchall()
+            GROUP BY s.queue_id, e.judge_id, j.name
+            ORDER BY s.queue_id, e.judge_id
+        """)
         
         # Organize data by queue
-        queue_stats = {}
-        for row in rows:
-            queue_id, judge_id, judge_name, verdict, count = row
-            
-            if queue_id not in queue_stats:
-                queue_stats[queue_id] = {}
-            
-            if judge_id not in queue_stats[queue_id]:
-                queue_stats[queue_id][judge_id] = {
-                    'judge_id': judge_id,
-                    'judge_name': judge_name,
-                    'pass': 0,
-                    'fail': 0,
-                    'inconclusive': 0,
-                    'total': 0
-                }
-            
-            queue_stats[queue_id][judge_id][verdict] = count
-            queue_stats[queue_id][judge_id]['total'] += count
-        
-        # Calculate pass rates
         result = {}
-        for queue_id, judges in queue_stats.items():
-            result[queue_id] = []
-            for judge_data in judges.values():
-                total = judge_data['total']
-                pass_rate = (judge_data['pass'] / total * 100) if total > 0 else 0
-                result[queue_id].append({
-                    'judge_id': judge_data['judge_id'],
-                    'judge_name': judge_data['judge_name'],
-                    'pass': judge_data['pass'],
-                    'fail': judge_data['fail'],
-                    'inconclusive': judge_data['inconclusive'],
-                    'total': total,
-                    'pass_rate': round(pass_rate, 2)
-                })
+        for row in rows:
+            result.setdefault(row.pop('queue_id'), []).append(row)
         
         return result
-    finally:
-        await db.close()
 
 
 # ==================== Review Queue Endpoints ====================
@@ -822,54 +795,42 @@ async def list_review_queue(
     offset: int = Query(0, ge=0),
 ):
     """List review queue items with optional filters."""
-    db = await get_db()
-    try:
+    async with get_reader() as db:
         return await get_review_queue_items(db, status=status, reason=reason, limit=limit, offset=offset)
-    finally:
-        await db.close()
 
 
 @app.get("/api/review-queue/stats", response_model=ReviewQueueStats)
 async def review_queue_stats():
     """Get aggregate review queue statistics."""
-    db = await get_db()
-    try:
+    async with get_reader() as db:
         return await get_review_stats(db)
-    finally:
-        await db.close()
 
 
 @app.get("/api/review-queue/{review_id}", response_model=ReviewItemResponse)
 async def get_review_queue_item(review_id: int):
     """Get a single review queue item with full context."""
-    db = await get_db()
-    try:
+    async with get_reader() as db:
         item = await get_review_item(db, review_id)
         if not item:
             raise HTTPException(status_code=404, detail="Review item not found")
         return item
-    finally:
-        await db.close()
 
 
 @app.post("/api/review-queue/{review_id}/verdict")
 async def post_human_verdict(review_id: int, request: HumanVerdictRequest):
     """Submit a human verdict for a review queue item."""
-    db = await get_db()
-    try:
+    async with get_writer() as db:
         updated = await submit_verdict(
             db, review_id, request.verdict, request.comment, request.reviewed_by
         )
         if not updated:
             raise HTTPException(status_code=404, detail="Review item not found")
         return {"message": "Verdict submitted successfully"}
-    finally:
-        await db.close()
 
 
 # ==================== Ollama Endpoints ====================
 
-@app.get("/api/ollama/models")
+@app.get("/api/ollama/models", response_class=ORJSONResponse)
 async def get_ollama_models():
     """Get available Ollama models."""
     try:
@@ -1,10 +1,13 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Dict, Any, Optional, Literal
 from datetime import datetime
 
 
-# Submission models
+# Submission models. Read-path models are frozen: they are only ever
+# built from uploaded or stored data and never modified afterwards.
 class QuestionData(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str
     questionType: str
     questionText: str
@@ -12,16 +15,22 @@ class QuestionData(BaseModel):
 
 
 class Question(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     rev: int
     data: QuestionData
 
 
 class Answer(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     choice: str
     reasoning: Optional[str] = None
 
 
 class Submission(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str
     queueId: str
     labelingTaskId: str
@@ -51,7 +60,7 @@ class JudgeResponse(BaseModel):
     system_prompt: str
     model_name: str
     active: bool
-    created_at: str
+    created_at: int  # unix epoch milliseconds
 
 
 # Assignment models
@@ -66,7 +75,7 @@ class AssignmentResponse(BaseModel):
     queue_id: str
     question_template_id: str
     judge_id: int
-    created_at: str
+    created_at: int  # unix epoch milliseconds
 
 
 # Evaluation models
@@ -74,6 +83,8 @@ VerdictType = Literal["pass", "fail", "inconclusive"]
 
 
 class EvaluationResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: int
     submission_id: str
     question_template_id: str
@@ -82,7 +93,7 @@ class EvaluationResponse(BaseModel):
     verdict: VerdictType
     reasoning: str
     confidence_score: int = 50
-    created_at: str
+    created_at: int  # unix epoch milliseconds
     question_text: Optional[str] = None
     answer_choice: Optional[str] = None
     answer_reasoning: Optional[str] = None
@@ -99,6 +110,7 @@ class EvaluationStats(BaseModel):
 
 class RunEvaluationRequest(BaseModel):
     queue_id: str
+    concurrency: int = Field(8, ge=1, le=32)  # max parallel Ollama calls
 
 
 class RunEvaluationResponse(BaseModel):
@@ -1,22 +1,147 @@
+import asyncio
 import httpx
-import json
-from typing import Optional, Literal
+import orjson
+import re
+import time
+from typing import Optional, Literal, Union
 
 OLLAMA_BASE_URL = "http://localhost:11434"
+JSON_HEADERS = {"Content-Type": "application/json"}
+MODELS_CACHE_TTL = 10.0
+MODELS_STALE_TTL = 60.0
+
+# One "FIELD: value" line of a judge response; parse_verdict scans the whole
+# response with it in a single pass instead of upper-casing every line
+_FIELD_RE = re.compile(
+    r"^[^\S\n]*(VERDICT|REASONING|CONFIDENCE):(.*)$", re.MULTILINE | re.IGNORECASE
+)
+# Checked instead of response.lstrip(), which would copy the whole response
+_JSON_START_RE = re.compile(r"\s*\{")
+
+# A verdict word that is not part of an echoed "pass|fail|inconclusive"
+_VERDICT_WORD = r"(?<![|/])\b(pass|fail|inconclusive)\b(?![|/])"
+
+# Used when there is no usable VERDICT: line, most explicit form first
+_FALLBACK_VERDICT_RES = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        # \boxed{pass}
+        r"\\boxed\{(pass|fail|inconclusive)\}",
+        # **PASS**, **Verdict: fail**
+        r"\*\*\s*(?:verdict\s*:\s*)?(pass|fail|inconclusive)\s*\.?\s*\*\*",
+        # **VERDICT:** pass, **Verdict**: fail
+        r"\*\*\s*verdict\s*:?\s*\*\*\s*:?\s*" + _VERDICT_WORD,
+        # "the verdict is pass", "Final verdict: FAIL"
+        r"\bverdict\s*(?:is|:|=)\s*[\"'`]?" + _VERDICT_WORD,
+        # A reply that is only the verdict
+        r"\A\W*(pass|fail|inconclusive)\W*\Z",
+    )
+)
+# Last resort: a lone verdict word in the closing text of the response. Skipped
+# when the tail names several verdicts ("pass or fail") or negates one
+# ("does not pass"), which would otherwise read as a confident wrong answer
+_FALLBACK_TAIL_CHARS = 200
+_VERDICT_WORD_RE = re.compile(_VERDICT_WORD, re.IGNORECASE)
+_NEGATION_RE = re.compile(
+    r"\b(?:not|never|no|cannot|can't|won't|didn't|doesn't|isn't)\s+(?:\w+\s+)?"
+    r"(?:pass|fail|inconclusive)\b",
+    re.IGNORECASE,
+)
+
+
+_VERDICTS = frozenset(("pass", "fail", "inconclusive"))
+
+# JSON schema passed as Ollama's `format` so judges answer with a JSON object
+# carrying the same three fields as the VERDICT/REASONING/CONFIDENCE lines
+VERDICT_FORMAT = {
+    "type": "object",
+    "properties": {
+        "verdict": {"enum": ["pass", "fail", "inconclusive"]},
+        "reasoning": {"type": "string"},
+        "confidence": {"type": "integer"},
+    },
+    "required": ["verdict", "reasoning", "confidence"],
+}
 
 
 class OllamaClient:
     """Client for interacting with Ollama API."""
     
-    def __init__(self, base_url: str = OLLAMA_BASE_URL, timeout: float = 120.0):
+    def __init__(
+        self,
+        base_url: str = OLLAMA_BASE_URL,
+        timeout: float = 120.0,
+        max_connections: int = 32,
+        keep_alive: str = "30m",
+    ):
         self.base_url = base_url
         self.timeout = timeout
+        # How long Ollama keeps a model loaded after a call; longer than a
+        # typical evaluation run so judges don't pay a reload between calls
+        self.keep_alive = keep_alive
+        self.max_connections = max_connections
+        self._client: Optional[httpx.AsyncClient] = None
+        self._models: Optional[tuple[float, list]] = None  # (fetched at, models)
+        self._models_lock = asyncio.Lock()
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared keep-alive client, created on first use so it binds to the running loop."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                # Fail fast when Ollama is down or the pool is exhausted;
+                # only reading the (slow) generation gets the long timeout
+                timeout=httpx.Timeout(
+                    connect=2.0, read=self.timeout, write=10.0, pool=5.0
+                ),
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                    keepalive_expiry=60.0,
+                ),
+            )
+        return self._client
+    
+    async def aclose(self) -> None:
+        """Close the shared client and its pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        # asyncio.Lock binds to the loop it is first awaited in
+        self._models_lock = asyncio.Lock()
+    
+    async def __aenter__(self) -> "OllamaClient":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+    
+    async def _post_stream(self, path: str, payload: dict):
+        """POST payload as JSON and yield each chunk of the NDJSON reply.
+
+        Chunks are decoded as they arrive, so the reply is never held as one
+        body; Ollama reports failures after the stream starts as an "error"
+        chunk.
+        """
+        async with self.client.stream(
+            "POST", path, content=orjson.dumps(payload), headers=JSON_HEADERS
+        ) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if not line:
+                    continue
+                chunk = orjson.loads(line)
+                if "error" in chunk:
+                    raise RuntimeError(f"Ollama error: {chunk['error']}")
+                yield chunk
     
     async def generate(
         self,
         model: str,
         prompt: str,
-        system: Optional[str] = None
+        system: Optional[str] = None,
+        format: Optional[Union[str, dict]] = None
     ) -> str:
         """
         Generate a response from Ollama.
@@ -25,27 +150,27 @@ class OllamaClient:
             model: Model name (e.g., 'llama2', 'mistral')
             prompt: User prompt
             system: System prompt/instructions
+            format: "json" or a JSON schema to constrain the output to
             
         Returns:
             Generated text response
         """
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            payload = {
-                "model": model,
-                "prompt": prompt,
-                "stream": False
-            }
-            
-            if system:
-                payload["system"] = system
-            
-            response = await client.post(
-                f"{self.base_url}/api/generate",
-                json=payload
-            )
-            response.raise_for_status()
-            result = response.json()
-            return result.get("response", "")
+        payload = {
+            "model": model,
+            "prompt": prompt,
+            "stream": True,
+            "keep_alive": self.keep_alive
+        }
+        
+        if system:
+            payload["system"] = system
+        if format is not None:
+            payload["format"] = format
+        
+        parts = []
+        async for chunk in self._post_stream("/api/generate", payload):
+            parts.append(chunk.get("response", ""))
+        return "".join(parts)
     
     async def chat(
         self,
@@ -62,28 +187,45 @@ class OllamaClient:
         Returns:
             Assistant's response
         """
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            payload = {
-                "model": model,
-                "messages": messages,
-                "stream": False
-            }
-            
-            response = await client.post(
-                f"{self.base_url}/api/chat",
-                json=payload
-            )
-            response.raise_for_status()
-            result = response.json()
-            return result.get("message", {}).get("content", "")
+        payload = {
+            "model": model,
+            "messages": messages,
+            "stream": True,
+            "keep_alive": self.keep_alive
+        }
+        
+        parts = []
+        async for chunk in self._post_stream("/api/chat", payload):
+            parts.append(chunk.get("message", {}).get("content", ""))
+        return "".join(parts)
     
     async def list_models(self) -> list:
-        """List available Ollama models."""
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(f"{self.base_url}/api/tags")
-            response.raise_for_status()
-            result = response.json()
-            return result.get("models", [])
+        """
+        List available Ollama models.
+        
+        The list changes rarely, so the last successful response is reused
+        for MODELS_CACHE_TTL seconds and concurrent cache misses share one
+        request. If Ollama is unreachable, the last response keeps being
+        returned until it is MODELS_STALE_TTL seconds old.
+        """
+        if self._models is not None and time.monotonic() - self._models[0] < MODELS_CACHE_TTL:
+            return self._models[1]
+        
+        async with self._models_lock:
+            # Another caller may have refreshed the list while we waited
+            now = time.monotonic()
+            if self._models is not None and now - self._models[0] < MODELS_CACHE_TTL:
+                return self._models[1]
+            try:
+                response = await self.client.get("/api/tags", timeout=10.0)
+                response.raise_for_status()
+                models = orjson.loads(response.content).get("models", [])
+            except Exception:
+                if self._models is not None and now - self._models[0] < MODELS_STALE_TTL:
+                    return self._models[1]
+                raise
+            self._models = (now, models)
+            return models
 
 
 def parse_verdict(response: str) -> tuple[Literal["pass", "fail", "inconclusive"], str, int]:
@@ -95,33 +237,49 @@ def parse_verdict(response: str) -> tuple[Literal["pass", "fail", "inconclusive"
     REASONING: explanation text
     CONFIDENCE: 0-100
     
+    or, when generated with format=VERDICT_FORMAT, a JSON object with
+    "verdict", "reasoning" and "confidence" keys. Without a usable VERDICT
+    line the verdict is taken from free text (\\boxed{}, **bold**, "the
+    verdict is ...", or the last verdict word) before defaulting to
+    inconclusive.
+    
     Args:
         response: Raw LLM response
         
     Returns:
         Tuple of (verdict, reasoning, confidence)
     """
-    lines = response.strip().split('\n')
+    if _JSON_START_RE.match(response):
+        parsed = _parse_json_verdict(response)
+        if parsed is not None:
+            return parsed
+    
     verdict: Literal["pass", "fail", "inconclusive"] = "inconclusive"
     reasoning = ""
     confidence = 50  # Default mid-range confidence
     
-    for line in lines:
-        line = line.strip()
-        if line.upper().startswith("VERDICT:"):
-            verdict_text = line.split(":", 1)[1].strip().lower()
-            if verdict_text in ["pass", "fail", "inconclusive"]:
+    # Stop at the first complete set of fields rather than scanning the
+    # rest of the response
+    found = set()
+    for match in _FIELD_RE.finditer(response):
+        field = match.group(1).upper()
+        if field == "VERDICT":
+            verdict_text = match.group(2).strip().lower()
+            if verdict_text in _VERDICTS:
                 verdict = verdict_text  # type: ignore
-        elif line.upper().startswith("REASONING:"):
-            reasoning = line.split(":", 1)[1].strip()
-        elif line.upper().startswith("CONFIDENCE:"):
-            try:
-                raw = line.split(":", 1)[1].strip()
-                # Handle cases like "85%" or "85/100"
-                raw = raw.replace("%", "").split("/")[0].strip()
-                confidence = max(0, min(100, int(float(raw))))
-            except (ValueError, IndexError):
-                confidence = 50
+                found.add(field)
+        elif field == "REASONING":
+            reasoning = match.group(2).strip()
+            if reasoning:
+                found.add(field)
+        else:
+            confidence = _parse_confidence(match.group(2))
+            found.add(field)
+        if len(found) == 3:
+            break
+    
+    if "VERDICT" not in found:
+        verdict = _fallback_verdict(response)
     
     # If no explicit reasoning found, use entire response
     if not reasoning:
@@ -129,3 +287,49 @@ def parse_verdict(response: str) -> tuple[Literal["pass", "fail", "inconclusive"
     
     return verdict, reasoning, confidence
 
+
+def _fallback_verdict(response: str) -> Literal["pass", "fail", "inconclusive"]:
+    """Pick a verdict out of a free-form response, or "inconclusive"."""
+    for pattern in _FALLBACK_VERDICT_RES:
+        match = pattern.search(response)
+        if match:
+            return match.group(1).lower()  # type: ignore
+    tail = response[-_FALLBACK_TAIL_CHARS:]
+    words = {match.group(1).lower() for match in _VERDICT_WORD_RE.finditer(tail)}
+    if len(words) == 1 and not _NEGATION_RE.search(tail):
+        return words.pop()  # type: ignore
+    return "inconclusive"
+
+
+def _parse_json_verdict(
+    response: str,
+) -> Optional[tuple[Literal["pass", "fail", "inconclusive"], str, int]]:
+    """Read a structured (JSON) judge response; None if it is not a JSON object."""
+    try:
+        data = orjson.loads(response)
+    except orjson.JSONDecodeError:
+        return None
+    if not isinstance(data, dict):
+        return None
+    
+    verdict: Literal["pass", "fail", "inconclusive"] = "inconclusive"
+    verdict_text = str(data.get("verdict", "")).strip().lower()
+    if verdict_text in _VERDICTS:
+        verdict = verdict_text  # type: ignore
+    reasoning = str(data.get("reasoning") or "").strip() or response.strip()
+    return verdict, reasoning, _parse_confidence(data.get("confidence"))
+
+
+def _parse_confidence(raw) -> int:
+    """Clamp a confidence value to 0-100; 50 if it cannot be read."""
+    try:
+        # Handle cases like "85%" or "85/100"
+        raw = str(raw).strip().replace("%", "").partition("/")[0].strip()
+        try:
+            value = int(raw)
+        except ValueError:
+            value = int(float(raw))  # "85.5", "1e2"
+        return max(0, min(100, value))
+    except (ValueError, OverflowError):
+        return 50
+
@@ -2,6 +2,7 @@ import json
 from datetime import datetime
 from typing import Optional, List, Tuple
 
+from database import fetch_all_dicts
 from models import EvaluationResponse, ReviewItemResponse, ReviewQueueStats
 
 
@@ -246,10 +247,12 @@ async def _fetch_evaluations_for_pair(
     db, submission_id: str, question_template_id: str
 ) -> List[EvaluationResponse]:
     """Fetch all evaluations for a (submission, question) pair."""
-    cursor = await db.execute(
+    rows = await fetch_all_dicts(
+        db,
         """SELECT e.id, e.submission_id, e.question_template_id, e.judge_id,
-                  j.name, e.verdict, e.reasoning, e.confidence_score, e.created_at,
-                  q.question_text, a.choice, a.reasoning
+                  j.name AS judge_name, e.verdict, e.reasoning, e.confidence_score,
+                  e.created_at, q.question_text, a.choice AS answer_choice,
+                  a.reasoning AS answer_reasoning
            FROM evaluations e
            JOIN judges j ON e.judge_id = j.id
            LEFT JOIN questions q ON e.submission_id = q.submission_id
@@ -260,21 +263,4 @@ async def _fetch_evaluations_for_pair(
            ORDER BY e.created_at DESC""",
         (submission_id, question_template_id),
     )
-    rows = await cursor.fetchall()
-    return [
-        EvaluationResponse(
-            id=r[0],
-            submission_id=r[1],
-            question_template_id=r[2],
-            judge_id=r[3],
-            judge_name=r[4],
-            verdict=r[5],
-            reasoning=r[6],
-            confidence_score=r[7],
-            created_at=r[8],
-            question_text=r[9],
-            answer_choice=r[10],
-            answer_reasoning=r[11],
-        )
-        for r in rows
-    ]
+    return [EvaluationResponse(**r) for r in rows]
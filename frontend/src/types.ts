@@ -8,7 +8,7 @@ export interface Judge {
   system_prompt: string;
   model_name: string;
   active: boolean;
-  created_at: string;
+  created_at: number;
 }
 
 export interface JudgeCreate {
@@ -68,7 +68,7 @@ export interface Evaluation {
   verdict: VerdictType;
   reasoning: string;
   confidence_score: number;
-  created_at: string;
+  created_at: number;
   question_text?: string;
   answer_choice?: string;
   answer_reasoning?: string;